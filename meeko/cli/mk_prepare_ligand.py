@@ -361,7 +361,8 @@ def main():
                     this_mol_had_failure = True
                     print(error_msg, file=sys.stderr)
                     
-            if args.verbose: preparator.show_setup()
+            for molsetup in molsetups:
+                molsetup.show(verbose=args.verbose)
 
         input_mol_with_failure += int(this_mol_had_failure)
 
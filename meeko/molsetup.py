@@ -6,6 +6,7 @@
 
 from copy import deepcopy
 from collections import defaultdict, OrderedDict
+from functools import lru_cache
 import json
 import warnings
 import sys
@@ -26,6 +27,13 @@ else:
     _has_openbabel = True
 
 
+@lru_cache(maxsize=None)
+def _compile_smarts(smarts):
+    """ SMARTS queries are compiled once and shared by all setups,
+        as the same patterns are matched against every molecule """
+    return Chem.MolFromSmarts(smarts)
+
+
 # TODO modify so that there are no more dictionaries and only list/arrays (fix me)
 # methods like add_x,del_x,get_x will deal with indexing (fix me)
 # the goal is to remove dictionaries (fix me)
@@ -486,49 +494,52 @@ class MoleculeSetup:
     def get_smiles_and_order(self):
         raise NotImplementedError("This method must be overloaded by inheriting class")
 
-    def show(self):
-        tot_charge = 0
-
-        print("Molecule setup\n")
-        print("==============[ ATOMS ]===================================================")
-        print("idx  |          coords            | charge |ign| atype    | connections")
-        print("-----+----------------------------+--------+---+----------+--------------- . . . ")
-        for k, v in list(self.coord.items()):
-            print("% 4d | % 8.3f % 8.3f % 8.3f | % 1.3f | %d" % (k, v[0], v[1], v[2],
-                  self.charge[k], self.atom_ignore[k]),
-                  "| % -8s |" % self.atom_type[k],
-                  self.graph[k])
-            tot_charge += self.charge[k]
-        print("-----+----------------------------+--------+---+----------+--------------- . . . ")
-        print("  TOT CHARGE: %3.3f" % tot_charge)
-
-        print("\n======[ DIRECTIONAL VECTORS ]==========")
-        for k, v in list(self.coord.items()):
-            if k in self.interaction_vector:
-                print("% 4d " % k, self.atom_type[k], end=' ')
-
-        print("\n==============[ BONDS ]================")
+    def show(self, verbose=True):
+        """ print atoms, directional vectors and bonds, unless verbose is False """
+        if not verbose:
+            return
+        tot_charge = sum(self.charge.values())
+
+        # collect all lines and print them at once
+        lines = ["Molecule setup", ""]
+        lines.append("==============[ ATOMS ]===================================================")
+        lines.append("idx  |          coords            | charge |ign| atype    | connections")
+        lines.append("-----+----------------------------+--------+---+----------+--------------- . . . ")
+        for k, v in self.coord.items():
+            lines.append("% 4d | % 8.3f % 8.3f % 8.3f | % 1.3f | %d | % -8s | %s" % (k, v[0], v[1], v[2],
+                  self.charge[k], self.atom_ignore[k], self.atom_type[k], self.graph[k]))
+        lines.append("-----+----------------------------+--------+---+----------+--------------- . . . ")
+        lines.append("  TOT CHARGE: %3.3f" % tot_charge)
+
+        lines.append("")
+        lines.append("======[ DIRECTIONAL VECTORS ]==========")
+        lines.append("".join("% 4d  %s " % (k, self.atom_type[k]) for k in self.coord if k in self.interaction_vector))
+
+        lines.append("==============[ BONDS ]================")
         # For sanity users, we won't show those keys for now
         keys_to_not_show = ['bond_order', 'type']
-        for k, v in list(self.bond.items()):
+        for k, v in self.bond.items():
             t = ', '.join('%s: %s' % (i, j) for i, j in v.items() if not i in keys_to_not_show)
-            print("% 8s - " % str(k), t)
+            lines.append("% 8s -  %s" % (str(k), t))
 
         # _macrocycle_typer.show_macrocycle_scores(self)
 
-        print('')
+        lines.append('')
+        print("\n".join(lines))
 
 
 
 class RDKitMoleculeSetup(MoleculeSetup):
 
+    warned_not3D = False
+
     @classmethod
     def from_mol(cls, mol, keep_chorded_rings=False, keep_equivalent_rings=False,
                  assign_charges=True, conformer_id=-1):
         if mol.GetNumConformers() == 0: 
             raise ValueError("RDKit molecule does not have a conformer. Need 3D coordinates.")
         rdkit_conformer = mol.GetConformer(conformer_id) 
-        if not rdkit_conformer.Is3D():
+        if not rdkit_conformer.Is3D() and not RDKitMoleculeSetup.warned_not3D:
             warnings.warn("RDKit molecule not labeled as 3D. This warning won't show again.")
             RDKitMoleculeSetup.warned_not3D = True
         if mol.GetNumConformers() > 1 and conformer_id == -1:
@@ -629,7 +640,9 @@ class RDKitMoleculeSetup(MoleculeSetup):
         return smiles, order
 
     def find_pattern(self, smarts):
-        p = Chem.MolFromSmarts(smarts)
+        p = _compile_smarts(smarts)
+        if p is None:
+            raise ValueError("invalid SMARTS: %s" % smarts)
         return self.mol.GetSubstructMatches(p)
 
     def get_mol_name(self):
@@ -4,10 +4,11 @@
 # Meeko preparation
 #
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from inspect import signature
 import os
 import sys
-from collections import OrderedDict
 import warnings
 
 from rdkit import Chem
@@ -29,10 +30,29 @@ except ImportError:
 else:
     _has_openbabel = True
 
+_SETUP_CLASSES = {Chem.rdchem.Mol: RDKitMoleculeSetup}
+if _has_openbabel:
+    _SETUP_CLASSES[ob.OBMol] = OBMoleculeSetup
+
+# instance used by each worker process of MoleculePreparation.prepare_many()
+_worker_preparation = None
+
+def _init_worker_preparation(cls, config):
+    global _worker_preparation
+    _worker_preparation = cls.from_config(config)
+    # keep _Name and other properties of the mols in the setups sent back
+    Chem.SetDefaultPickleProperties(Chem.PropertyPickleOptions.AllProps)
+
+def _worker_prepare(mol_binary, **kwargs):
+    return _worker_preparation.prepare(Chem.Mol(mol_binary), **kwargs)
+
 # DeprecationWarning is not displayed by default
 warnings.filterwarnings("default", category=DeprecationWarning)
 
 class MoleculePreparation:
+    """ typers and builders are created once in __init__ and shared by all
+        calls to prepare(), so one instance should be reused for many molecules """
+
     def __init__(self,
             merge_these_atom_types=("H",),
             hydrate=False,
@@ -78,9 +98,6 @@ class MoleculePreparation:
                 self.min_ring_size, self.max_ring_size, self.double_bond_penalty)
         self._flex_builder = FlexibilityBuilder()
         self._water_builder = HydrateMoleculeLegacy()
-        self._classes_setup = {Chem.rdchem.Mol: RDKitMoleculeSetup}
-        if _has_openbabel:
-            self._classes_setup[ob.OBMol] = OBMoleculeSetup
         if keep_chorded_rings and keep_equivalent_rings==False:
             warnings.warn("keep_equivalent_rings=False ignored because keep_chorded_rings=True", RuntimeWarning)
         if (reactive_smarts is None) != (reactive_smarts_idx is None):
@@ -93,13 +110,20 @@ class MoleculePreparation:
         warnings.warn(msg, DeprecationWarning)
         return self.deprecated_setup_access
 
+    def reset(self):
+        """ forget the last prepared molecule, keeping typers and options """
+        self.deprecated_setup_access = None
+
     @classmethod
     def get_defaults_dict(cls):
-        defaults = {}
-        sig = signature(cls)
-        for key in sig.parameters:
-            defaults[key] = sig.parameters[key].default 
-        return defaults
+        # inspecting the signature is slow, cache it for each (sub)class
+        if "_defaults_cache" not in cls.__dict__:
+            defaults = {}
+            sig = signature(cls)
+            for key in sig.parameters:
+                defaults[key] = sig.parameters[key].default 
+            cls._defaults_cache = defaults
+        return dict(cls._defaults_cache) # callers may modify the returned dict
 
     @ classmethod
     def from_config(cls, config):
@@ -123,6 +147,9 @@ class MoleculePreparation:
         """ 
         Create molecule setup from RDKit molecule
 
+        Can be called repeatedly on the same instance, each call returns
+        new MoleculeSetup instances and only overwrites the deprecated `setup`.
+
         Args:
             mol (rdkit.Chem.rdchem.Mol): with explicit hydrogens and 3D coordinates
             root_atom_index (int): to set ROOT of torsion tree instead of searching
@@ -132,10 +159,9 @@ class MoleculePreparation:
                                       each bond is a tuple of two ints (atom 0-indices)
             glue_pseudo_atoms (dict): keys are parent atom indices, values are (x, y, z)
         """
-        mol_type = type(mol)
-        if not mol_type in self._classes_setup:
+        setup_class = _SETUP_CLASSES.get(type(mol))
+        if setup_class is None:
             raise TypeError("Molecule is not an instance of supported types: %s" % type(mol))
-        setup_class = self._classes_setup[mol_type]
         setup = setup_class.from_mol(mol,
             keep_chorded_rings=self.keep_chorded_rings,
             keep_equivalent_rings=self.keep_equivalent_rings,
@@ -151,11 +177,8 @@ class MoleculePreparation:
         # disabled
 
         # merge hydrogens (or any terminal atoms)
-        indices = set()
-        for atype_to_merge in self.merge_these_atom_types:
-            for index, atype in setup.atom_type.items():
-                if atype == atype_to_merge:
-                    indices.add(index)
+        merge_set = frozenset(self.merge_these_atom_types)
+        indices = {index for index, atype in setup.atom_type.items() if atype in merge_set}
         setup.merge_terminal_atoms(indices)
 
         # 3.  assign bond types by using SMARTS...
@@ -209,11 +232,49 @@ class MoleculePreparation:
         return setups
 
 
+    def prepare_many(self, mols, max_workers=None, **kwargs):
+        """
+        Create molecule setups for many molecules with the same options
+
+        Args:
+            mols (iterable): molecules of any type accepted by prepare()
+            max_workers (int): if given, molecules are prepared in parallel by
+                               a pool of processes. Only RDKit molecules are
+                               supported, and the returned setups hold copies
+                               of the input mols (properties included)
+            kwargs: passed to prepare() for every molecule
+
+        Returns:
+            list: for each molecule, the list of setups returned by prepare()
+        """
+        if max_workers is None:
+            prepare = partial(self.prepare, **kwargs)
+            return [prepare(mol) for mol in mols]
+        # workers build their own instance, as the typers keep scratch
+        # data from previous molecules that can't be pickled
+        config = {key: getattr(self, key) for key in self.get_defaults_dict()}
+        mol_binaries = []
+        for mol in mols:
+            if type(mol) is not Chem.rdchem.Mol:
+                raise TypeError("Molecule is not an instance of supported types: %s" % type(mol))
+            # default pickling of RDKit mols drops properties such as _Name
+            mol_binaries.append(mol.ToBinary(Chem.PropertyPickleOptions.AllProps))
+        with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_preparation,
+                initargs=(type(self), config)) as executor:
+            prepare = partial(_worker_prepare, **kwargs)
+            setups_list = list(executor.map(prepare, mol_binaries))
+        if len(setups_list):
+            self.deprecated_setup_access = setups_list[-1][0]
+        return setups_list
+
     @staticmethod
     def check_external_ring_break(molsetup, break_ring_bonds, glue_pseudo_atoms):
+        bonds = molsetup.bond
+        get_bond_id = molsetup.get_bond_id
         for (index1, index2) in break_ring_bonds:
-            has_bond = molsetup.get_bond_id(index1, index2) in molsetup.bond
-            if not has_bond:
+            if get_bond_id(index1, index2) not in bonds:
                 raise ValueError("bond (%d, %d) not in molsetup" % (index1, index2))
             for index in (index1, index2):
                 if index not in glue_pseudo_atoms:
@@ -224,6 +285,8 @@ class MoleculePreparation:
 
 
     def write_pdbqt_string(self, add_index_map=None, remove_smiles=None):
+        """ deprecated: writes the setup of the last molecule passed to prepare(),
+            use PDBQTWriterLegacy.write_string() on the returned setups instead """
         msg = "MoleculePreparation.write_pdbqt_string() is deprecated in Meeko v0.5."
         msg += " Pass the MoleculeSetup instance to PDBQTWriterLegacy.write_string()."
         msg += " MoleculePreparation.prepare() returns a list of MoleculeSetup instances."
@@ -117,24 +117,27 @@ class PDBQTWriterLegacy():
 
         success = True
         error_msg = ""
-        
+        mol_name = setup.get_mol_name()
+        errors = []
+
         if setup.has_implicit_hydrogens():
-            error_msg += "molecule has implicit hydrogens (name=%s)\n" % setup.get_mol_name()
-            success = False
+            errors.append("molecule has implicit hydrogens (name=%s)" % mol_name)
 
+        atom_ignore = setup.atom_ignore
+        charges = setup.charge
         for idx, atom_type in setup.atom_type.items():
-            if setup.atom_ignore[idx]:
+            if atom_ignore[idx]:
                 continue
             if atom_type is None:
-                error_msg += 'atom number %d has None type, mol name: %s\n' % (idx, setup.get_mol_name())
-                success = False
-            c = setup.charge[idx]
+                errors.append('atom number %d has None type, mol name: %s' % (idx, mol_name))
+            c = charges[idx]
             if not bad_charge_ok and (type(c) != float and type(c) != int or math.isnan(c) or math.isinf(c)):
-                error_msg += 'atom number %d has non finite charge, mol name: %s, charge: %s\n' % (idx, setup.get_mol_name(), str(c))
-                success = False
+                errors.append('atom number %d has non finite charge, mol name: %s, charge: %s' % (idx, mol_name, str(c)))
 
-        if not success:
+        if errors:
             pdbqt_string = ""
+            success = False
+            error_msg = "\n".join(errors) + "\n"
             return pdbqt_string, success, error_msg
 
         data = {
@@ -262,21 +265,15 @@ class PDBQTWriterLegacy():
              - remove TORSDOF
             this is for covalent docking (tethered)
         """
-        new_string = "BEGIN_RES %s %s %s\n" % (res, chain, num)
+        skip_prefixes = ("TORSDOF",)
+        buffer = ["BEGIN_RES %s %s %s" % (res, chain, num)]
         atom_number = 0
-        for line in pdbqt_string.split("\n"):
-            if line == "":
-                continue
-            if line.startswith("TORSDOF"):
+        for line in pdbqt_string.splitlines():
+            if not line or line.startswith(skip_prefixes):
                 continue
-            if line.startswith("ATOM"):
+            if atom_number < 2 and line.startswith("ATOM"):
                 atom_number+=1
-                if atom_number == 1:
-                    line = line[:13] + 'CA' + line[15:]
-                elif atom_number == 2:
-                    line = line[:13] + 'CB' + line[15:]
-                new_string += line + '\n'
-                continue
-            new_string += line + '\n'
-        new_string += "END_RES %s %s %s\n" % (res, chain, num)
-        return new_string
+                line = line[:13] + ('CA', 'CB')[atom_number - 1] + line[15:]
+            buffer.append(line)
+        buffer.append("END_RES %s %s %s" % (res, chain, num))
+        return '\n'.join(buffer) + '\n'
@@ -0,0 +1,39 @@
+from meeko import MoleculePreparation
+from meeko import PDBQTWriterLegacy
+from rdkit import Chem
+from rdkit.Chem import rdDistGeom
+import pytest
+
+mk_prep = MoleculePreparation()
+
+def get_mols():
+    mols = []
+    for i, smiles in enumerate(["CCO", "c1ccccc1O", "CC(=O)NC"]):
+        mol = Chem.AddHs(Chem.MolFromSmiles(smiles))
+        rdDistGeom.EmbedMolecule(mol, randomSeed=42)
+        mol.SetProp("_Name", "mol%d" % i)
+        mols.append(mol)
+    return mols
+
+def check(mols, setups_list):
+    assert(len(setups_list) == len(mols))
+    for mol, setups in zip(mols, setups_list):
+        expected, _, _ = PDBQTWriterLegacy.write_string(mk_prep.prepare(mol)[0])
+        pdbqt_string, is_ok, _ = PDBQTWriterLegacy.write_string(setups[0])
+        assert(is_ok)
+        assert(pdbqt_string == expected)
+        assert(setups[0].name == mol.GetProp("_Name"))
+        assert(setups[0].get_mol_name() == mol.GetProp("_Name"))
+
+def test_prepare_many():
+    mols = get_mols()
+    check(mols, mk_prep.prepare_many(mols))
+
+def test_prepare_many_parallel():
+    mols = get_mols()
+    check(mols, mk_prep.prepare_many(mols, max_workers=2))
+
+def test_prepare_many_parallel_unsupported_type():
+    mols = get_mols() + ["CCO"]
+    with pytest.raises(TypeError):
+        mk_prep.prepare_many(mols, max_workers=2)
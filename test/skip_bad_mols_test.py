@@ -1,17 +1,18 @@
 from meeko import MoleculePreparation
 from meeko import PDBQTWriterLegacy
+from meeko import RDKitMoleculeSetup
 from rdkit import Chem
 from rdkit.Chem import rdDistGeom
 import warnings
 import pytest
 
+mk_prep = MoleculePreparation()
 
 def test():
     p = Chem.SmilesParserParams()
     mol = Chem.MolFromSmiles("Oc1ccc(cc1)[N+](=O)[O-]\tnitrophenol", p)
     etkdg_params = Chem.rdDistGeom.ETKDGv3()
     Chem.rdDistGeom.EmbedMolecule(mol, etkdg_params)
-    mk_prep = MoleculePreparation()
     with warnings.catch_warnings(record=True) as cought:
         setups = mk_prep.prepare(mol)
         for w in cought:
@@ -19,11 +20,37 @@ def test():
     pdbqt, is_ok, error_msg = PDBQTWriterLegacy.write_string(setups[0])
     assert(is_ok == False)
 
-mk_prep = MoleculePreparation()
-
 def test_no_conformer():
     mol = Chem.MolFromSmiles("C1CCCOC1")
     mol = Chem.AddHs(mol)
     with pytest.raises(ValueError) as e:
         mk_prep.prepare(mol)
     assert(str(e.value).endswith("Need 3D coordinates."))
+
+def test_bad_rigidify_smarts():
+    mol = Chem.MolFromSmiles("C1CCCOC1")
+    mol = Chem.AddHs(mol)
+    Chem.rdDistGeom.EmbedMolecule(mol, Chem.rdDistGeom.ETKDGv3())
+    mk_prep_bad_smarts = MoleculePreparation(
+        rigidify_bonds_smarts=["C(("],
+        rigidify_bonds_indices=[(1, 2)],
+    )
+    with pytest.raises(ValueError) as e:
+        mk_prep_bad_smarts.prepare(mol)
+    assert("SMARTS" in str(e.value))
+
+def test_not_3d_warns_once():
+    mols = []
+    for smiles in ["CCO", "CCN"]:
+        mol = Chem.AddHs(Chem.MolFromSmiles(smiles))
+        Chem.rdDistGeom.EmbedMolecule(mol, Chem.rdDistGeom.ETKDGv3())
+        mol.GetConformer().Set3D(False)
+        mols.append(mol)
+    RDKitMoleculeSetup.warned_not3D = False
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for mol in mols:
+            mk_prep.prepare(mol)
+    RDKitMoleculeSetup.warned_not3D = False
+    not_3d = [w for w in caught if "not labeled as 3D" in str(w.message)]
+    assert(len(not_3d) == 1)